@@ -16,20 +16,40 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from .._array.array import ndarray
 from .._array.util import add_boilerplate
-from .creation_shape import empty
+from .creation_shape import empty, zeros
 
 if TYPE_CHECKING:
-    from .._array.array import ndarray
+    import numpy.typing as npt
+
     from ..types import BitOrder
 
+# Interned once so the per-call dtype guard does not rebuild its container
+_INT_KINDS = frozenset(("u", "i", "b"))
+
 
 def _sanitize_arguments(
     a: ndarray, axis: int | None, bitorder: BitOrder
 ) -> tuple[ndarray, int]:
     if axis is None:
         if a.ndim > 1:
-            a = a.ravel()
+            if a.size == 0:
+                # The deferred thunk reshape cannot group zero-extent
+                # dimensions; the generic entry point special-cases empty
+                # arrays, so let it handle them
+                a = a.ravel()
+            else:
+                # a.ravel() funnels through the generic reshape entry
+                # point, which re-validates the new shape and resolves the
+                # unknown extent on every call. The flattened extent is
+                # already known here, so go to the thunk directly; the
+                # eager thunk still returns a zero-copy view when NumPy
+                # can, while the deferred multi-dim flattening copies
+                # either way
+                a = ndarray(shape=None, thunk=a._thunk.reshape((a.size,), "C"))
         sanitized_axis = 0
     elif axis < 0:
         sanitized_axis = axis + a.ndim
@@ -47,15 +67,51 @@ def _sanitize_arguments(
     return a, sanitized_axis
 
 
+def _replace_extent(
+    shape: tuple[int, ...], axis: int, extent: int
+) -> tuple[int, ...]:
+    # Builds the output shape with the packing axis replaced by `extent`.
+    # The generic list() + tuple() round-trip costs two container
+    # constructions per call, which is measurable in launch-dominated
+    # workloads, so the common low ranks are unrolled
+    ndim = len(shape)
+    if ndim == 1:
+        return (extent,)
+    if ndim == 2:
+        return (extent, shape[1]) if axis == 0 else (shape[0], extent)
+    if ndim == 3:
+        if axis == 0:
+            return (extent, shape[1], shape[2])
+        if axis == 1:
+            return (shape[0], extent, shape[2])
+        return (shape[0], shape[1], extent)
+    if ndim == 4:
+        if axis == 0:
+            return (extent, shape[1], shape[2], shape[3])
+        if axis == 1:
+            return (shape[0], extent, shape[2], shape[3])
+        if axis == 2:
+            return (shape[0], shape[1], extent, shape[3])
+        return (shape[0], shape[1], shape[2], extent)
+    out_shape = list(shape)
+    out_shape[axis] = extent
+    return tuple(out_shape)
+
+
 @add_boilerplate("a")
 def packbits(
-    a: ndarray, axis: int | None = None, bitorder: BitOrder = "big"
+    a: ndarray,
+    axis: int | None = None,
+    bitorder: BitOrder = "big",
+    dtype: npt.DTypeLike = "B",
+    out: ndarray | None = None,
 ) -> ndarray:
     """
 
-    Packs the elements of a binary-valued array into bits in a uint8 array.
+    Packs the elements of a binary-valued array into bits in an unsigned
+    integer array.
 
-    The result is padded to full bytes by inserting zero bits at the end.
+    The result is padded to full words by inserting zero bits at the end.
 
     Parameters
     ----------
@@ -70,12 +126,22 @@ def packbits(
         ``[0, 0, 0, 0, 0, 0, 1, 1] => 3 = 0b00000011``, 'little' will
         reverse the order so ``[1, 1, 0, 0, 0, 0, 0, 0] => 3``.
         Defaults to "big".
+    dtype : data-type, optional
+        The unsigned integer data type of the packed output, one of uint8,
+        uint16, uint32 or uint64. Each output word packs ``8 * itemsize``
+        input elements, with `bitorder` applied across the whole word; the
+        default uint8 matches NumPy. This extends :func:`numpy.packbits`,
+        which only produces uint8.
+    out : ndarray, optional
+        A location into which the result is stored. Must have the output
+        shape and the packed data type. Reusing a preallocated buffer
+        avoids an allocation per call in iterative workloads.
 
     Returns
     -------
     packed : ndarray
-        Array of type uint8 whose elements represent bits corresponding to the
-        logical (0 or nonzero) value of the input elements. The shape of
+        Array of type `dtype` whose elements represent bits corresponding to
+        the logical (0 or nonzero) value of the input elements. The shape of
         `packed` has the same number of dimensions as the input (unless `axis`
         is None, in which case the output is 1-D).
 
@@ -88,29 +154,88 @@ def packbits(
     Multiple GPUs, Multiple CPUs
     """
 
-    if a.dtype.kind not in ("u", "i", "b"):
+    if a.dtype.kind not in _INT_KINDS:
         raise TypeError(
             "Expected an input array of integer or boolean data type"
         )
 
+    packed_dtype = np.dtype(dtype)
+    if packed_dtype.kind != "u":
+        raise TypeError(
+            "Expected an unsigned integer data type for the packed output"
+        )
+
     a, sanitized_axis = _sanitize_arguments(a, axis, bitorder)
 
-    out_shape = tuple(
-        (extent + 7) // 8 if dim == sanitized_axis else extent
-        for dim, extent in enumerate(a.shape)
-    )
-    out = empty(out_shape, dtype="B")
+    word_bits = 8 * packed_dtype.itemsize
+    out_extent = (a.shape[sanitized_axis] + word_bits - 1) // word_bits
+    out_shape = _replace_extent(a.shape, sanitized_axis, out_extent)
+    if out is None:
+        out = empty(out_shape, dtype=packed_dtype)
+    else:
+        if out.shape != out_shape:
+            raise ValueError(
+                f"out array has wrong shape: expected {out_shape}, "
+                f"got {out.shape}"
+            )
+        if out.dtype != packed_dtype:
+            raise TypeError(
+                f"out array has wrong data type: expected {packed_dtype}, "
+                f"got {out.dtype}"
+            )
     out._thunk.packbits(a._thunk, sanitized_axis, bitorder)
 
     return out
 
 
+def packbits_fast(a: ndarray) -> ndarray:
+    """
+    Packs a one-dimensional boolean or uint8 array into bits.
+
+    Equivalent to ``packbits(a)`` for a 1-D bool or uint8 cuPyNumeric
+    ndarray, but skips the argument conversion and sanitization layers,
+    which dominate the cost of packing short arrays. This trades generality
+    for call overhead: the input must already be a cuPyNumeric ndarray and
+    only the default ``axis=None`` / ``bitorder="big"`` behavior is
+    provided.
+
+    Parameters
+    ----------
+    a : ndarray
+        One-dimensional array of bool or uint8 data type.
+
+    Returns
+    -------
+    packed : ndarray[uint8]
+        Array of type uint8 whose elements represent bits corresponding to
+        the logical (0 or nonzero) value of the input elements.
+
+    See Also
+    --------
+    packbits
+
+    Availability
+    --------
+    Multiple GPUs, Multiple CPUs
+    """
+
+    if not isinstance(a, ndarray) or a.ndim != 1 or a.dtype.char not in "?B":
+        raise ValueError(
+            "packbits_fast requires a 1-D bool or uint8 cuPyNumeric ndarray"
+        )
+
+    out = empty(((a.shape[0] + 7) // 8,), dtype="B")
+    out._thunk.packbits(a._thunk, 0, "big")
+    return out
+
+
 @add_boilerplate("a")
 def unpackbits(
     a: ndarray,
     axis: int | None = None,
     count: int | None = None,
     bitorder: BitOrder = "big",
+    out: ndarray | None = None,
 ) -> ndarray:
     """
     Unpacks elements of a uint8 array into a binary-valued output array.
@@ -142,6 +267,10 @@ def unpackbits(
         ``3 = 0b00000011 => [0, 0, 0, 0, 0, 0, 1, 1]``, 'little' will reverse
         the order to ``[1, 1, 0, 0, 0, 0, 0, 0]``.
         Defaults to 'big'.
+    out : ndarray, optional
+        A location into which the result is stored. Must be of uint8 data
+        type and have the output shape. Reusing a preallocated buffer
+        avoids an allocation per call in iterative workloads.
 
     Returns
     -------
@@ -166,20 +295,89 @@ def unpackbits(
     a, sanitized_axis = _sanitize_arguments(a, axis, bitorder)
 
     axis_extent = a.shape[sanitized_axis] * 8
-    out_shape = tuple(
-        axis_extent if dim == sanitized_axis else extent
-        for dim, extent in enumerate(a.shape)
-    )
-    out = empty(out_shape, dtype="B")
-    out._thunk.unpackbits(a._thunk, sanitized_axis, bitorder)
-
-    if count is not None and count != axis_extent:
-        # TODO: We could handle `count` directly in the unpack task to avoid
-        # generating the full unpack result. For now we simply slice out the
-        # output for the count.
-        slices = tuple(
-            slice(None, count if dim == sanitized_axis else None)
-            for dim in range(a.ndim)
+    if count is None:
+        sanitized_count = axis_extent
+    else:
+        sanitized_count = count + axis_extent if count < 0 else count
+        if sanitized_count < 0:
+            raise ValueError("-count larger than number of elements")
+
+    # The output is allocated with its final extent and the unpack task only
+    # writes `count` elements along the axis, instead of generating the full
+    # unpack result and slicing it afterwards
+    out_shape = _replace_extent(a.shape, sanitized_axis, sanitized_count)
+    if out is not None:
+        if out.shape != out_shape:
+            raise ValueError(
+                f"out array has wrong shape: expected {out_shape}, "
+                f"got {out.shape}"
+            )
+        if out.dtype != np.uint8:
+            raise TypeError("Expected an out array of unsigned byte data type")
+    if sanitized_count > axis_extent:
+        # Counts beyond the available bits pad the output with zeros, so
+        # allocate the final extent pre-zeroed and unpack into a view of
+        # the leading bits, preserving the padding
+        if out is None:
+            out = zeros(out_shape, dtype="B")
+        else:
+            out.fill(0)
+        # The leading-bits view is along the first or last dimension in
+        # the common cases, where the O(ndim) slice-tuple build can be
+        # skipped
+        if sanitized_axis == 0:
+            target = out[:axis_extent]
+        elif sanitized_axis == a.ndim - 1:
+            target = out[..., :axis_extent]
+        else:
+            slices = tuple(
+                slice(axis_extent) if dim == sanitized_axis else slice(None)
+                for dim in range(a.ndim)
+            )
+            target = out[slices]
+        target._thunk.unpackbits(
+            a._thunk, sanitized_axis, bitorder, axis_extent
         )
-        out = out[slices]
+    else:
+        if out is None:
+            out = empty(out_shape, dtype="B")
+        out._thunk.unpackbits(
+            a._thunk, sanitized_axis, bitorder, sanitized_count
+        )
+
     return out
+
+
+@add_boilerplate("a")
+def count_nonzero_packed(a: ndarray) -> int | ndarray:
+    """
+    Counts the set bits in a uint8 array of packed bits.
+
+    Equivalent to ``unpackbits(a).sum()``, but computed directly on the
+    packed bytes, without materializing the 8x-larger unpacked array.
+
+    Parameters
+    ----------
+    a : ndarray[uint8]
+       Input array of packed bits, as produced by :func:`packbits`.
+
+    Returns
+    -------
+    count : int or ndarray[uint64]
+        Number of set bits in the array.
+
+    See Also
+    --------
+    packbits, unpackbits, count_nonzero
+
+    Availability
+    --------
+    Multiple GPUs, Multiple CPUs
+    """
+
+    if a.dtype != "B":
+        raise TypeError("Expected an input array of unsigned byte data type")
+
+    out = empty((1,), dtype=np.uint64)
+    out._thunk.bitcount(a._thunk)
+    return out[0]
@@ -0,0 +1,141 @@
+# Copyright 2024 NVIDIA Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Optional Numba-parallelized kernels for the eager bit-packing fallback.
+
+The eager fallback for packbits/unpackbits otherwise delegates to the
+single-threaded np.packbits/np.unpackbits. Bit packing is memory-bound, so
+when Numba is installed, packing along the last axis of C-contiguous arrays
+is handled by ``@njit(parallel=True)`` kernels instead, multiplying the
+effective memory bandwidth across cores. Numba remains strictly optional;
+without it every call takes the NumPy path.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+try:
+    from numba import njit, prange  # type: ignore
+except ImportError:
+    njit = None
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from ..types import BitOrder
+
+# Below this input size the JIT dispatch overhead outweighs any gain from
+# parallel execution, so small arrays stay on the NumPy path
+_MIN_SIZE = 1 << 16
+
+
+if njit is not None:
+    # The kernels are generated per bitorder: `big` is a closure variable,
+    # which Numba folds as a compile-time constant and prunes the dead
+    # branch, so the generated inner loops carry no per-byte bitorder check.
+    # lru_cache keeps one compiled kernel per bitorder
+
+    @lru_cache(maxsize=None)
+    def _pack_last_axis(big: bool) -> Any:
+        @njit(parallel=True, cache=True)  # type: ignore [untyped-decorator]
+        def kernel(
+            a_flat: Any, out_flat: Any, n_in: int, n_bytes: int
+        ) -> None:  # pragma: no cover
+            for b in prange(out_flat.shape[0]):
+                row = b // n_bytes
+                base = row * n_in + (b % n_bytes) * 8
+                rem = min(8, n_in - (b % n_bytes) * 8)
+                acc = np.uint8(0)
+                if big:
+                    for j in range(rem):
+                        acc = np.uint8((acc << 1) | (a_flat[base + j] != 0))
+                    acc = np.uint8(acc << (8 - rem))
+                else:
+                    for j in range(rem):
+                        acc = np.uint8(acc | (a_flat[base + j] != 0) << j)
+                out_flat[b] = acc
+
+        return kernel
+
+    @lru_cache(maxsize=None)
+    def _unpack_last_axis(big: bool) -> Any:
+        @njit(parallel=True, cache=True)  # type: ignore [untyped-decorator]
+        def kernel(
+            a_flat: Any, out_flat: Any, n_bytes: int, n_out: int
+        ) -> None:  # pragma: no cover
+            for b in prange(a_flat.shape[0]):
+                row = b // n_bytes
+                base = row * n_out + (b % n_bytes) * 8
+                rem = min(8, n_out - (b % n_bytes) * 8)
+                val = a_flat[b]
+                if big:
+                    for j in range(rem):
+                        out_flat[base + j] = (val >> (7 - j)) & 1
+                else:
+                    for j in range(rem):
+                        out_flat[base + j] = (val >> j) & 1
+
+        return kernel
+
+
+def maybe_pack_bits(
+    out: npt.NDArray[Any],
+    src: npt.NDArray[Any],
+    axis: int | None,
+    bitorder: BitOrder,
+) -> bool:
+    """Pack with the Numba kernel if eligible; returns False otherwise."""
+    if (
+        njit is None
+        or axis != src.ndim - 1
+        or src.size < _MIN_SIZE
+        or src.dtype.itemsize != 1
+        or not src.flags.c_contiguous
+        or not out.flags.c_contiguous
+    ):
+        return False
+    _pack_last_axis(bitorder == "big")(
+        src.reshape(-1).view(np.uint8),
+        out.reshape(-1),
+        src.shape[-1],
+        out.shape[-1],
+    )
+    return True
+
+
+def maybe_unpack_bits(
+    out: npt.NDArray[Any],
+    src: npt.NDArray[Any],
+    axis: int | None,
+    bitorder: BitOrder,
+) -> bool:
+    """Unpack with the Numba kernel if eligible; returns False otherwise."""
+    if (
+        njit is None
+        or axis != src.ndim - 1
+        or out.size < _MIN_SIZE
+        or not src.flags.c_contiguous
+        or not out.flags.c_contiguous
+    ):
+        return False
+    _unpack_last_axis(bitorder == "big")(
+        src.reshape(-1),
+        out.reshape(-1),
+        src.shape[-1],
+        out.shape[-1],
+    )
+    return True
@@ -3651,14 +3651,22 @@ class DeferredArray(NumPyThunk):
         task.add_input(src.base, p_in)
         task.add_scalar_arg(axis, ty.uint32)
         task.add_scalar_arg(bitorder_code, ty.uint32)
-        factors = tuple(8 if dim == axis else 1 for dim in range(src.ndim))
+        # Each output word packs one bit per input element, so a wider
+        # output type packs proportionally more input elements
+        word_bits = 8 * self.base.type.size
+        factors = tuple(
+            word_bits if dim == axis else 1 for dim in range(src.ndim)
+        )
         task.add_constraint(scale(factors, p_out, p_in))  # type: ignore
         task.execute()
 
     @auto_convert("src")
     def unpackbits(
-        self, src: Any, axis: int | None, bitorder: BitOrder
+        self, src: Any, axis: int | None, bitorder: BitOrder, count: int
     ) -> None:
+        # `count` is already encoded in the shape of the output store; the
+        # task clips its writes to the output rectangle, so the scalar does
+        # not need to be passed along
         bitorder_code = getattr(Bitorder, bitorder.upper())
         task = legate_runtime.create_auto_task(
             self.library, CuPyNumericOpCode.UNPACKBITS
@@ -3673,6 +3681,17 @@ class DeferredArray(NumPyThunk):
         task.add_constraint(scale(factors, p_in, p_out))  # type: ignore
         task.execute()
 
+    @auto_convert("src")
+    def bitcount(self, src: Any) -> None:
+        self.fill(np.array(0, dtype=self.dtype))
+        task = legate_runtime.create_auto_task(
+            self.library, CuPyNumericOpCode.BITCOUNT
+        )
+        p_lhs = task.add_reduction(self.base, ReductionOpKind.ADD)
+        task.add_input(src.base)
+        task.add_constraint(broadcast(p_lhs))
+        task.execute()
+
     @auto_convert("src")
     def _wrap(self, src: Any, new_len: int) -> None:
         if src.base.has_scalar_storage or src.base.transformed:
@@ -36,6 +36,7 @@ from ..config import (
     WindowOpCode,
 )
 from ..runtime import runtime
+from ._numba_bitpack import maybe_pack_bits, maybe_unpack_bits
 from .deferred import DeferredArray
 from .thunk import NumPyThunk
 
@@ -173,6 +174,36 @@ _WINDOW_OPS: dict[
     WindowOpCode.KAISER: np.kaiser,
 }
 
+# Number of set bits for every possible byte value, used by the bitcount
+# fallback to avoid materializing the 8x-larger unpacked array
+_POPCOUNT_TABLE = np.array(
+    [bin(val).count("1") for val in range(256)], dtype=np.uint64
+)
+
+
+def _pack_wide(
+    a: npt.NDArray[Any],
+    axis: int | None,
+    bitorder: BitOrder,
+    dtype: np.dtype[Any],
+) -> npt.NDArray[Any]:
+    # np.packbits only produces uint8, so pack to bytes first, pad the
+    # packed axis to whole words and reinterpret groups of bytes as words.
+    # For bitorder "big" the first byte holds the most significant bits of
+    # the word, i.e. a big-endian view, and vice versa for "little"
+    packed = np.packbits(a, axis=axis, bitorder=bitorder)
+    if axis is None:
+        axis = 0
+    packed = np.moveaxis(packed, axis, -1)
+    itemsize = dtype.itemsize
+    pad = -packed.shape[-1] % itemsize
+    if pad > 0:
+        widths = [(0, 0)] * (packed.ndim - 1) + [(0, pad)]
+        packed = np.pad(packed, widths)
+    byteorder = ">" if bitorder == "big" else "<"
+    words = np.ascontiguousarray(packed).view(f"{byteorder}u{itemsize}")
+    return np.moveaxis(words.astype(dtype), -1, axis)
+
 
 def eye_reference(
     shape: NdShape, dtype: np.dtype[Any], axes: tuple[int, ...]
@@ -1778,22 +1809,33 @@ class EagerArray(NumPyThunk):
         self.check_eager_args(src)
         if self.deferred is not None:
             self.deferred.packbits(src, axis, bitorder)
-        else:
+        elif self.array.dtype != np.uint8:
+            self.array[:] = _pack_wide(
+                src.array, axis, bitorder, self.array.dtype
+            )
+        elif not maybe_pack_bits(self.array, src.array, axis, bitorder):
             self.array[:] = np.packbits(
                 src.array, axis=axis, bitorder=bitorder
             )
 
     def unpackbits(
-        self, src: Any, axis: int | None, bitorder: BitOrder
+        self, src: Any, axis: int | None, bitorder: BitOrder, count: int
     ) -> None:
         self.check_eager_args(src)
         if self.deferred is not None:
-            self.deferred.unpackbits(src, axis, bitorder)
-        else:
+            self.deferred.unpackbits(src, axis, bitorder, count)
+        elif not maybe_unpack_bits(self.array, src.array, axis, bitorder):
             self.array[:] = np.unpackbits(
-                src.array, axis=axis, bitorder=bitorder
+                src.array, axis=axis, count=count, bitorder=bitorder
             )
 
+    def bitcount(self, src: Any) -> None:
+        self.check_eager_args(src)
+        if self.deferred is not None:
+            self.deferred.bitcount(src)
+        else:
+            self.array[:] = _POPCOUNT_TABLE[src.array].sum()
+
     def _wrap(self, src: Any, new_len: int) -> None:
         self.check_eager_args(src)
         if self.deferred is not None:
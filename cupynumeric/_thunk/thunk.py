@@ -744,10 +744,14 @@ class NumPyThunk(ABC):
 
     @abstractmethod
     def unpackbits(
-        self, src: Any, axis: int | None, bitorder: BitOrder
+        self, src: Any, axis: int | None, bitorder: BitOrder, count: int
     ) -> None:
         ...
 
+    @abstractmethod
+    def bitcount(self, src: Any) -> None:
+        ...
+
     @abstractmethod
     def _wrap(self, src: Any, new_len: int) -> None:
         ...
@@ -41,6 +41,7 @@ class _CupynumericSharedLib:
     CUPYNUMERIC_BINARY_OP: int
     CUPYNUMERIC_BINARY_RED: int
     CUPYNUMERIC_BINCOUNT: int
+    CUPYNUMERIC_BITCOUNT: int
     CUPYNUMERIC_BINOP_ADD: int
     CUPYNUMERIC_BINOP_ARCTAN2: int
     CUPYNUMERIC_BINOP_BITWISE_AND: int
@@ -373,6 +374,7 @@ class CuPyNumericOpCode(IntEnum):
     BINARY_OP = _cupynumeric.CUPYNUMERIC_BINARY_OP
     BINARY_RED = _cupynumeric.CUPYNUMERIC_BINARY_RED
     BINCOUNT = _cupynumeric.CUPYNUMERIC_BINCOUNT
+    BITCOUNT = _cupynumeric.CUPYNUMERIC_BITCOUNT
     BITGENERATOR = _cupynumeric.CUPYNUMERIC_BITGENERATOR
     CHOOSE = _cupynumeric.CUPYNUMERIC_CHOOSE
     CONTRACT = _cupynumeric.CUPYNUMERIC_CONTRACT
@@ -153,6 +153,7 @@ list(APPEND cupynumeric_SOURCES
   src/cupynumeric/binary/binary_op.cc
   src/cupynumeric/binary/binary_op_util.cc
   src/cupynumeric/binary/binary_red.cc
+  src/cupynumeric/bits/bitcount.cc
   src/cupynumeric/bits/packbits.cc
   src/cupynumeric/bits/unpackbits.cc
   src/cupynumeric/unary/scalar_unary_red.cc
@@ -219,6 +220,7 @@ if(Legion_USE_OpenMP)
     src/cupynumeric/scan/scan_local_omp.cc
     src/cupynumeric/binary/binary_op_omp.cc
     src/cupynumeric/binary/binary_red_omp.cc
+    src/cupynumeric/bits/bitcount_omp.cc
     src/cupynumeric/bits/packbits_omp.cc
     src/cupynumeric/bits/unpackbits_omp.cc
     src/cupynumeric/unary/unary_op_omp.cc
@@ -271,6 +273,7 @@ if(Legion_USE_CUDA)
     src/cupynumeric/scan/scan_local.cu
     src/cupynumeric/binary/binary_op.cu
     src/cupynumeric/binary/binary_red.cu
+    src/cupynumeric/bits/bitcount.cu
     src/cupynumeric/bits/packbits.cu
     src/cupynumeric/bits/unpackbits.cu
     src/cupynumeric/unary/scalar_unary_red.cu
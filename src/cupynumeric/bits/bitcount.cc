@@ -0,0 +1,58 @@
+/* Copyright 2024 NVIDIA Corporation
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ */
+
+#include "cupynumeric/bits/bitcount.h"
+#include "cupynumeric/bits/bitcount_template.inl"
+#include "cupynumeric/bits/popcount_simd.h"
+
+namespace cupynumeric {
+
+using namespace legate;
+
+template <int32_t DIM>
+struct BitcountImplBody<VariantKind::CPU, DIM> {
+  template <typename AccessorRD>
+  void operator()(AccessorRD lhs,
+                  const AccessorRO<uint8_t, DIM>& rhs,
+                  const Rect<DIM>& rect,
+                  const Pitches<DIM - 1>& pitches,
+                  size_t volume,
+                  bool dense) const
+  {
+    if (dense) {
+      lhs.reduce(0, detail::popcount_bytes(rhs.ptr(rect), volume));
+    } else {
+      uint64_t sum = 0;
+      for (size_t idx = 0; idx < volume; ++idx) {
+        auto p = pitches.unflatten(idx, rect.lo);
+        sum += detail::popcount_byte(rhs[p]);
+      }
+      lhs.reduce(0, sum);
+    }
+  }
+};
+
+/*static*/ void BitcountTask::cpu_variant(TaskContext context)
+{
+  bitcount_template<VariantKind::CPU>(context);
+}
+
+namespace  // unnamed
+{
+static void __attribute__((constructor)) register_tasks(void) { BitcountTask::register_variants(); }
+}  // namespace
+
+}  // namespace cupynumeric
@@ -0,0 +1,86 @@
+/* Copyright 2024 NVIDIA Corporation
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ */
+
+#include "cupynumeric/bits/bitcount.h"
+#include "cupynumeric/bits/bitcount_template.inl"
+#include "cupynumeric/cuda_help.h"
+
+namespace cupynumeric {
+
+using namespace legate;
+
+// Each thread counts the set bits of one byte with __popc; adjacent threads
+// of a warp read adjacent bytes, so the loads coalesce into full
+// transactions and the partial sums are folded with the standard
+// shuffle-based block reduction
+template <typename Output, typename ReadAcc, typename Pitches, typename Point>
+static __global__ void __launch_bounds__(THREADS_PER_BLOCK, MIN_CTAS_PER_SM) reduction_kernel(
+  size_t volume, Output out, ReadAcc rhs, Pitches pitches, Point origin, size_t iters)
+{
+  uint64_t value = SumReduction<uint64_t>::identity;
+  for (size_t idx = 0; idx < iters; idx++) {
+    const size_t offset = (idx * gridDim.x + blockIdx.x) * blockDim.x + threadIdx.x;
+    if (offset < volume) {
+      auto point = pitches.unflatten(offset, origin);
+      SumReduction<uint64_t>::fold<true>(value, static_cast<uint64_t>(__popc(rhs[point])));
+    }
+  }
+  // Every thread in the thread block must participate in the exchange to get correct results
+  reduce_output(out, value);
+}
+
+template <typename Buffer, typename RedAcc>
+static __global__ void __launch_bounds__(1, 1) copy_kernel(Buffer result, RedAcc out)
+{
+  out.reduce(0, result.read());
+}
+
+template <int32_t DIM>
+struct BitcountImplBody<VariantKind::GPU, DIM> {
+  template <typename AccessorRD>
+  void operator()(AccessorRD lhs,
+                  const AccessorRO<uint8_t, DIM>& rhs,
+                  const Rect<DIM>& rect,
+                  const Pitches<DIM - 1>& pitches,
+                  size_t volume,
+                  bool dense) const
+  {
+    auto stream = get_cached_stream();
+
+    const size_t blocks = (volume + THREADS_PER_BLOCK - 1) / THREADS_PER_BLOCK;
+    DeviceScalarReductionBuffer<SumReduction<uint64_t>> result(stream);
+    size_t shmem_size = THREADS_PER_BLOCK / 32 * sizeof(uint64_t);
+
+    if (blocks >= MAX_REDUCTION_CTAS) {
+      const size_t iters = (blocks + MAX_REDUCTION_CTAS - 1) / MAX_REDUCTION_CTAS;
+      reduction_kernel<<<MAX_REDUCTION_CTAS, THREADS_PER_BLOCK, shmem_size, stream>>>(
+        volume, result, rhs, pitches, rect.lo, iters);
+    } else {
+      reduction_kernel<<<blocks, THREADS_PER_BLOCK, shmem_size, stream>>>(
+        volume, result, rhs, pitches, rect.lo, 1);
+    }
+
+    copy_kernel<<<1, 1, 0, stream>>>(result, lhs);
+    CUPYNUMERIC_CHECK_CUDA_STREAM(stream);
+  }
+};
+
+/*static*/ void BitcountTask::gpu_variant(TaskContext context)
+{
+  bitcount_template<VariantKind::GPU>(context);
+}
+
+}  // namespace cupynumeric
@@ -0,0 +1,82 @@
+/* Copyright 2024 NVIDIA Corporation
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ */
+
+#include "cupynumeric/bits/bitcount.h"
+#include "cupynumeric/bits/bitcount_template.inl"
+#include "cupynumeric/bits/popcount_simd.h"
+#include "cupynumeric/omp_help.h"
+
+#include <algorithm>
+
+#include <omp.h>
+
+namespace cupynumeric {
+
+using namespace legate;
+
+template <int32_t DIM>
+struct BitcountImplBody<VariantKind::OMP, DIM> {
+  template <typename AccessorRD>
+  void operator()(AccessorRD lhs,
+                  const AccessorRO<uint8_t, DIM>& rhs,
+                  const Rect<DIM>& rect,
+                  const Pitches<DIM - 1>& pitches,
+                  size_t volume,
+                  bool dense) const
+  {
+    const auto max_threads = omp_get_max_threads();
+    ThreadLocalStorage<uint64_t> locals(max_threads);
+    for (auto idx = 0; idx < max_threads; ++idx) {
+      locals[idx] = 0;
+    }
+
+    if (dense) {
+      auto rhsptr = rhs.ptr(rect);
+#pragma omp parallel
+      {
+        const int tid         = omp_get_thread_num();
+        const size_t nthreads = omp_get_num_threads();
+        // Hand each thread one contiguous chunk so the SIMD popcount sees
+        // long runs of bytes
+        const size_t chunk = (volume + nthreads - 1) / nthreads;
+        const size_t lo    = std::min(tid * chunk, volume);
+        const size_t hi    = std::min(lo + chunk, volume);
+        locals[tid] += detail::popcount_bytes(rhsptr + lo, hi - lo);
+      }
+    } else {
+#pragma omp parallel
+      {
+        const int tid = omp_get_thread_num();
+#pragma omp for schedule(static)
+        for (size_t idx = 0; idx < volume; ++idx) {
+          auto p = pitches.unflatten(idx, rect.lo);
+          locals[tid] += detail::popcount_byte(rhs[p]);
+        }
+      }
+    }
+
+    for (auto idx = 0; idx < max_threads; ++idx) {
+      lhs.reduce(0, locals[idx]);
+    }
+  }
+};
+
+/*static*/ void BitcountTask::omp_variant(TaskContext context)
+{
+  bitcount_template<VariantKind::OMP>(context);
+}
+
+}  // namespace cupynumeric
@@ -0,0 +1,66 @@
+/* Copyright 2024 NVIDIA Corporation
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ */
+
+#pragma once
+
+// Useful for IDEs
+#include "cupynumeric/bits/bitcount.h"
+#include "cupynumeric/pitches.h"
+
+namespace cupynumeric {
+
+using namespace legate;
+
+template <VariantKind KIND, int32_t DIM>
+struct BitcountImplBody;
+
+template <VariantKind KIND>
+struct BitcountImpl {
+  template <int32_t DIM>
+  void operator()(BitcountArgs& args) const
+  {
+    auto rect = args.rhs.shape<DIM>();
+    auto lhs  = args.lhs.reduce_accessor<SumReduction<uint64_t>, KIND != VariantKind::GPU, 1>();
+
+    if (rect.empty()) {
+      return;
+    }
+
+    auto rhs = args.rhs.read_accessor<uint8_t, DIM>(rect);
+
+    Pitches<DIM - 1> pitches{};
+    size_t volume = pitches.flatten(rect);
+
+#if !LEGATE_DEFINED(LEGATE_BOUNDS_CHECKS)
+    // Check to see if this is dense or not
+    bool dense = rhs.accessor.is_dense_row_major(rect);
+#else
+    // No dense execution if we're doing bounds checks
+    bool dense = false;
+#endif
+
+    BitcountImplBody<KIND, DIM>()(lhs, rhs, rect, pitches, volume, dense);
+  }
+};
+
+template <VariantKind KIND>
+static void bitcount_template(TaskContext& context)
+{
+  BitcountArgs args{context.reduction(0), context.input(0)};
+  dim_dispatch(args.rhs.dim(), BitcountImpl<KIND>{}, args);
+}
+
+}  // namespace cupynumeric
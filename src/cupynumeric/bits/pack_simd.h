@@ -0,0 +1,259 @@
+/* Copyright 2024 NVIDIA Corporation
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ */
+
+#pragma once
+
+#include "cupynumeric/bits/bits_util.h"
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+
+#if (defined(__x86_64__) || defined(__i386__)) && defined(__GNUC__)
+#define CUPYNUMERIC_PACK_SIMD_X86 1
+#include <immintrin.h>
+#elif defined(__aarch64__) && defined(__GNUC__)
+#define CUPYNUMERIC_PACK_SIMD_NEON 1
+#include <arm_neon.h>
+#endif
+
+namespace cupynumeric {
+namespace detail {
+
+// Reverses the bit order within a byte. Movemask-style instructions produce
+// LSB-first masks, which is the layout of bitorder="little"; bitorder="big"
+// needs the bits of every output byte mirrored.
+constexpr uint8_t reverse_byte(uint8_t v)
+{
+  v = static_cast<uint8_t>((v & 0xF0) >> 4 | (v & 0x0F) << 4);
+  v = static_cast<uint8_t>((v & 0xCC) >> 2 | (v & 0x33) << 2);
+  v = static_cast<uint8_t>((v & 0xAA) >> 1 | (v & 0x55) << 1);
+  return v;
+}
+
+// Reverses the bytes of a word, used to convert a little-endian run of
+// packed bytes into a bitorder="big" word on little-endian hosts
+template <typename WORD>
+inline WORD byteswap_word(WORD w)
+{
+  if constexpr (sizeof(WORD) == 2) {
+    return __builtin_bswap16(w);
+  } else if constexpr (sizeof(WORD) == 4) {
+    return __builtin_bswap32(w);
+  } else if constexpr (sizeof(WORD) == 8) {
+    return __builtin_bswap64(w);
+  } else {
+    return w;
+  }
+}
+
+// Packs `n` (<= 8) leading input bytes into a single output byte, padding
+// with zero bits at the end the same way the generic Pack functors do.
+template <Bitorder BITORDER>
+inline uint8_t pack_byte_scalar(const uint8_t* in, int64_t n)
+{
+  uint8_t acc = 0;
+  if constexpr (BITORDER == Bitorder::BIG) {
+    for (int64_t j = 0; j < n; ++j) {
+      acc = static_cast<uint8_t>((acc << 1) | (in[j] != 0));
+    }
+    acc = static_cast<uint8_t>(acc << (8 - n));
+  } else {
+    for (int64_t j = 0; j < n; ++j) {
+      acc = static_cast<uint8_t>(acc | (in[j] != 0) << j);
+    }
+  }
+  return acc;
+}
+
+// Handles the sub-16-element remainder of a row, shared by all ISA variants
+template <Bitorder BITORDER>
+inline void pack_row_tail(uint8_t* out, const uint8_t* in, int64_t idx, int64_t n_in)
+{
+  for (; idx + 8 <= n_in; idx += 8) {
+    *out++ = pack_byte_scalar<BITORDER>(in + idx, 8);
+  }
+  if (idx < n_in) {
+    *out = pack_byte_scalar<BITORDER>(in + idx, n_in - idx);
+  }
+}
+
+template <Bitorder BITORDER>
+void pack_row_scalar(uint8_t* out, const uint8_t* in, int64_t n_in)
+{
+  pack_row_tail<BITORDER>(out, in, 0, n_in);
+}
+
+#if defined(CUPYNUMERIC_PACK_SIMD_X86)
+
+// _mm_movemask_epi8 collapses 16 comparison results into a 16-bit mask with
+// bit i set exactly when in[i] != 0, i.e. two packed output bytes
+template <Bitorder BITORDER>
+__attribute__((target("sse2"))) void pack_row_sse2(uint8_t* out, const uint8_t* in, int64_t n_in)
+{
+  const __m128i zero = _mm_setzero_si128();
+  int64_t idx        = 0;
+  for (; idx + 16 <= n_in; idx += 16) {
+    __m128i v = _mm_loadu_si128(reinterpret_cast<const __m128i*>(in + idx));
+    auto mask = static_cast<uint16_t>(~_mm_movemask_epi8(_mm_cmpeq_epi8(v, zero)));
+    for (int32_t byte = 0; byte < 2; ++byte) {
+      auto bits = static_cast<uint8_t>(mask >> (8 * byte));
+      *out++    = BITORDER == Bitorder::BIG ? reverse_byte(bits) : bits;
+    }
+  }
+  pack_row_tail<BITORDER>(out, in, idx, n_in);
+}
+
+// Same as the SSE2 variant, at twice the width: 32 elements per movemask
+template <Bitorder BITORDER>
+__attribute__((target("avx2"))) void pack_row_avx2(uint8_t* out, const uint8_t* in, int64_t n_in)
+{
+  const __m256i zero = _mm256_setzero_si256();
+  int64_t idx        = 0;
+  for (; idx + 32 <= n_in; idx += 32) {
+    __m256i v = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(in + idx));
+    auto mask = static_cast<uint32_t>(~_mm256_movemask_epi8(_mm256_cmpeq_epi8(v, zero)));
+    for (int32_t byte = 0; byte < 4; ++byte) {
+      auto bits = static_cast<uint8_t>(mask >> (8 * byte));
+      *out++    = BITORDER == Bitorder::BIG ? reverse_byte(bits) : bits;
+    }
+  }
+  pack_row_tail<BITORDER>(out, in, idx, n_in);
+}
+
+// _mm512_test_epi8_mask packs 64 elements into a __mmask64 in a single
+// instruction. The loop advances in full vectors, so a row that starts on
+// a 64-byte boundary stays aligned throughout and can use aligned loads,
+// which save a uop on older Intel microarchitectures; the alignment is
+// probed once per row rather than per load
+template <Bitorder BITORDER, bool ALIGNED>
+__attribute__((target("avx512bw"))) int64_t pack_row_avx512_loop(uint8_t*& out,
+                                                                 const uint8_t* in,
+                                                                 int64_t n_in)
+{
+  int64_t idx = 0;
+  for (; idx + 64 <= n_in; idx += 64) {
+    __m512i v     = ALIGNED ? _mm512_load_si512(reinterpret_cast<const void*>(in + idx))
+                            : _mm512_loadu_si512(reinterpret_cast<const void*>(in + idx));
+    uint64_t mask = _cvtmask64_u64(_mm512_test_epi8_mask(v, v));
+    for (int32_t byte = 0; byte < 8; ++byte) {
+      auto bits = static_cast<uint8_t>(mask >> (8 * byte));
+      *out++    = BITORDER == Bitorder::BIG ? reverse_byte(bits) : bits;
+    }
+  }
+  return idx;
+}
+
+template <Bitorder BITORDER>
+__attribute__((target("avx512bw"))) void pack_row_avx512(uint8_t* out,
+                                                         const uint8_t* in,
+                                                         int64_t n_in)
+{
+  const int64_t idx = (reinterpret_cast<uintptr_t>(in) % 64) == 0
+                        ? pack_row_avx512_loop<BITORDER, true>(out, in, n_in)
+                        : pack_row_avx512_loop<BITORDER, false>(out, in, n_in);
+  pack_row_tail<BITORDER>(out, in, idx, n_in);
+}
+
+#endif  // CUPYNUMERIC_PACK_SIMD_X86
+
+#if defined(CUPYNUMERIC_PACK_SIMD_NEON)
+
+// NEON has no movemask; instead the nonzero tests (0xFF/0x00 lanes from
+// vcgtq_u8) are ANDed with a per-lane bit weight and folded with three
+// pairwise adds, yielding two packed bytes per 16 input elements. The
+// weights bake the bitorder in, so no post-hoc bit mirroring is needed
+template <Bitorder BITORDER>
+inline uint8x16_t pack_neon_weights()
+{
+  // clang-format off
+  alignas(16) static constexpr uint8_t big[16]    = {0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01,
+                                                     0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01};
+  alignas(16) static constexpr uint8_t little[16] = {0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80,
+                                                     0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80};
+  // clang-format on
+  return vld1q_u8(BITORDER == Bitorder::BIG ? big : little);
+}
+
+inline uint16_t pack16_neon(const uint8_t* in, uint8x16_t weights)
+{
+  uint8x16_t w = vandq_u8(vcgtq_u8(vld1q_u8(in), vdupq_n_u8(0)), weights);
+  w            = vpaddq_u8(w, w);
+  w            = vpaddq_u8(w, w);
+  w            = vpaddq_u8(w, w);
+  return vgetq_lane_u16(vreinterpretq_u16_u8(w), 0);
+}
+
+// Unrolled four ways: the four independent fold chains fill the multiple
+// NEON pipes of recent Arm cores instead of serializing on one
+template <Bitorder BITORDER>
+void pack_row_neon(uint8_t* out, const uint8_t* in, int64_t n_in)
+{
+  const uint8x16_t weights = pack_neon_weights<BITORDER>();
+  int64_t idx              = 0;
+  for (; idx + 64 <= n_in; idx += 64) {
+    const uint16_t pairs[4] = {pack16_neon(in + idx, weights),
+                               pack16_neon(in + idx + 16, weights),
+                               pack16_neon(in + idx + 32, weights),
+                               pack16_neon(in + idx + 48, weights)};
+    std::memcpy(out, pairs, sizeof(pairs));
+    out += 8;
+  }
+  for (; idx + 16 <= n_in; idx += 16) {
+    const uint16_t pair = pack16_neon(in + idx, weights);
+    std::memcpy(out, &pair, sizeof(pair));
+    out += 2;
+  }
+  pack_row_tail<BITORDER>(out, in, idx, n_in);
+}
+
+#endif  // CUPYNUMERIC_PACK_SIMD_NEON
+
+using PackRowFn = void (*)(uint8_t*, const uint8_t*, int64_t);
+
+// Picks the widest pack kernel the host CPU supports; called exactly once
+// per bitorder
+template <Bitorder BITORDER>
+inline PackRowFn resolve_pack_row()
+{
+#if defined(CUPYNUMERIC_PACK_SIMD_X86)
+  if (__builtin_cpu_supports("avx512bw")) {
+    return pack_row_avx512<BITORDER>;
+  }
+  if (__builtin_cpu_supports("avx2")) {
+    return pack_row_avx2<BITORDER>;
+  }
+  if (__builtin_cpu_supports("sse2")) {
+    return pack_row_sse2<BITORDER>;
+  }
+#elif defined(CUPYNUMERIC_PACK_SIMD_NEON)
+  // Advanced SIMD is architectural on AArch64, no runtime probe needed
+  return pack_row_neon<BITORDER>;
+#endif
+  return pack_row_scalar<BITORDER>;
+}
+
+// Packs one contiguous row of `n_in` one-byte elements into ceil(n_in / 8)
+// output bytes, dispatching to the widest available ISA
+template <Bitorder BITORDER>
+inline void pack_contiguous_row(uint8_t* out, const uint8_t* in, int64_t n_in)
+{
+  static const PackRowFn fn = resolve_pack_row<BITORDER>();
+  fn(out, in, n_in);
+}
+
+}  // namespace detail
+}  // namespace cupynumeric
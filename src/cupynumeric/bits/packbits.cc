@@ -16,6 +16,10 @@
 
 #include "cupynumeric/bits/packbits.h"
 #include "cupynumeric/bits/packbits_template.inl"
+#include "cupynumeric/bits/pack_simd.h"
+
+#include <algorithm>
+#include <cstring>
 
 namespace cupynumeric {
 
@@ -25,8 +29,11 @@ template <Type::Code CODE, int32_t DIM, Bitorder BITORDER>
 struct PackbitsImplBody<VariantKind::CPU, CODE, DIM, BITORDER> {
   using VAL = type_of<CODE>;
 
-  void operator()(const AccessorWO<uint8_t, DIM>& out,
+  template <typename WORD>
+  void operator()(const AccessorWO<WORD, DIM>& out,
                   const AccessorRO<VAL, DIM>& in,
+                  const Rect<DIM>& out_rect,
+                  const Rect<DIM>& in_rect,
                   const Rect<DIM>& aligned_rect,
                   const Rect<DIM>& unaligned_rect,
                   const Pitches<DIM - 1>& aligned_pitches,
@@ -34,10 +41,59 @@ struct PackbitsImplBody<VariantKind::CPU, CODE, DIM, BITORDER> {
                   size_t aligned_volume,
                   size_t unaligned_volume,
                   int64_t in_hi_axis,
-                  uint32_t axis) const
+                  uint32_t axis,
+                  bool dense) const
   {
-    Pack<BITORDER, true /* ALIGNED */> op{};
-    Pack<BITORDER, false /* ALIGNED */> op_unaligned{};
+    // Fast path: when both stores are dense and packing is done along the
+    // contiguous last axis, each output row is produced from a contiguous
+    // run of one-byte elements, which the SIMD row kernel handles directly.
+    // Wider words are assembled byte-wise into the output buffer: on a
+    // little-endian host the packed bytes already land in word order for
+    // bitorder "little", while "big" needs a byte swap within each word
+    if constexpr (sizeof(VAL) == 1) {
+      if (dense && axis == static_cast<uint32_t>(DIM - 1)) {
+        constexpr int64_t WORD_BITS = sizeof(WORD) * 8;
+        const int64_t out_row       = out_rect.hi[axis] - out_rect.lo[axis] + 1;
+        const int64_t in_row        = in_rect.hi[axis] - in_rect.lo[axis] + 1;
+        if ((in_row + WORD_BITS - 1) / WORD_BITS == out_row) {
+          auto* outptr       = out.ptr(out_rect);
+          const auto* inptr  = reinterpret_cast<const uint8_t*>(in.ptr(in_rect));
+          const size_t nrows = out_rect.volume() / out_row;
+          for (size_t row = 0; row < nrows; ++row) {
+            auto* out_words = outptr + row * out_row;
+            auto* out_bytes = reinterpret_cast<uint8_t*>(out_words);
+            // Zero the pad bytes of the last word that the row kernel
+            // does not reach
+            const int64_t n_bytes = (in_row + 7) / 8;
+            std::memset(out_bytes + n_bytes, 0, out_row * sizeof(WORD) - n_bytes);
+            detail::pack_contiguous_row<BITORDER>(out_bytes, inptr + row * in_row, in_row);
+            if constexpr (sizeof(WORD) > 1) {
+              if (BITORDER == Bitorder::BIG) {
+                for (int64_t word = 0; word < out_row; ++word) {
+                  out_words[word] = detail::byteswap_word(out_words[word]);
+                }
+              }
+            }
+          }
+          return;
+        }
+      }
+    }
+
+    Pack<BITORDER, true /* ALIGNED */, WORD> op{};
+    Pack<BITORDER, false /* ALIGNED */, WORD> op_unaligned{};
+
+    // Packing along a non-contiguous axis gathers strided input elements
+    // for every output word, so walk the output in tiles over the packing
+    // axis and the contiguous last axis to keep the input block feeding a
+    // tile resident in L1 instead of streaming it once per output word
+    if constexpr (DIM >= 2) {
+      if (axis != static_cast<uint32_t>(DIM - 1)) {
+        pack_tiled(out, in, aligned_rect, op, in_hi_axis, axis);
+        pack_tiled(out, in, unaligned_rect, op_unaligned, in_hi_axis, axis);
+        return;
+      }
+    }
 
     for (size_t idx = 0; idx < aligned_volume; ++idx) {
       auto out_p = aligned_pitches.unflatten(idx, aligned_rect.lo);
@@ -48,6 +104,41 @@ struct PackbitsImplBody<VariantKind::CPU, CODE, DIM, BITORDER> {
       out[out_p] = op_unaligned(in, out_p, in_hi_axis, axis);
     }
   }
+
+ private:
+  // A 64x64 output tile reads at most an 8 * 64 x 64 one-byte input block,
+  // which fits in a 32KB L1 data cache together with the tile itself
+  static constexpr int64_t TILE = 64;
+
+  template <typename WORD, typename OP>
+  void pack_tiled(const AccessorWO<WORD, DIM>& out,
+                  const AccessorRO<VAL, DIM>& in,
+                  const Rect<DIM>& rect,
+                  OP op,
+                  int64_t in_hi_axis,
+                  uint32_t axis) const
+  {
+    if (rect.empty()) {
+      return;
+    }
+    constexpr int32_t LAST = DIM - 1;
+    for (auto axis_lo = rect.lo[axis]; axis_lo <= rect.hi[axis]; axis_lo += TILE) {
+      for (auto last_lo = rect.lo[LAST]; last_lo <= rect.hi[LAST]; last_lo += TILE) {
+        auto tile     = rect;
+        tile.lo[axis] = axis_lo;
+        tile.hi[axis] = std::min<int64_t>(axis_lo + TILE - 1, rect.hi[axis]);
+        tile.lo[LAST] = last_lo;
+        tile.hi[LAST] = std::min<int64_t>(last_lo + TILE - 1, rect.hi[LAST]);
+
+        Pitches<DIM - 1> pitches{};
+        auto volume = pitches.flatten(tile);
+        for (size_t idx = 0; idx < volume; ++idx) {
+          auto out_p = pitches.unflatten(idx, tile.lo);
+          out[out_p] = op(in, out_p, in_hi_axis, axis);
+        }
+      }
+    }
+  }
 };
 
 /*static*/ void PackbitsTask::cpu_variant(TaskContext context)
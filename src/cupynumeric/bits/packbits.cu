@@ -18,10 +18,48 @@
 #include "cupynumeric/bits/packbits_template.inl"
 #include "cupynumeric/cuda_help.h"
 
+#include <type_traits>
+
 namespace cupynumeric {
 
 using namespace legate;
 
+// One warp covers 32 consecutive input elements of a row: __ballot_sync
+// collapses the 32 nonzero tests into a 32-bit mask in a single
+// instruction, i.e. 4 packed output bytes per warp with no shift loop.
+// Lanes 0-3 each store one byte of the mask; for bitorder="big" the bits
+// of every byte are mirrored via __brev. Output bytes past the end of a
+// row (the zero-padded tail) are simply not written by their warp
+template <Bitorder BITORDER>
+static __global__ void __launch_bounds__(THREADS_PER_BLOCK, MIN_CTAS_PER_SM)
+  ballot_pack_kernel(size_t num_warps,
+                     size_t warps_per_row,
+                     int64_t in_row,
+                     int64_t out_row,
+                     uint8_t* out,
+                     const uint8_t* in)
+{
+  const size_t tid    = global_tid_1d();
+  const size_t warp   = tid / 32;
+  const uint32_t lane = static_cast<uint32_t>(tid % 32);
+  if (warp >= num_warps) {
+    return;
+  }
+  const size_t row     = warp / warps_per_row;
+  const int64_t offset = static_cast<int64_t>(warp % warps_per_row);
+  const int64_t col    = offset * 32 + lane;
+  const bool pred      = col < in_row && in[row * in_row + col] != 0;
+  const uint32_t mask  = __ballot_sync(0xFFFFFFFFU, pred);
+  const int64_t byte   = offset * 4 + lane;
+  if (lane < 4 && byte < out_row) {
+    uint32_t bits = (mask >> (8 * lane)) & 0xFF;
+    if (BITORDER == Bitorder::BIG) {
+      bits = __brev(bits) >> 24;
+    }
+    out[row * out_row + byte] = static_cast<uint8_t>(bits);
+  }
+}
+
 template <typename PackOP, typename WriteAcc, typename ReadAcc, typename Pitches, typename Point>
 static __global__ void __launch_bounds__(THREADS_PER_BLOCK, MIN_CTAS_PER_SM)
   generic_kernel(size_t volume,
@@ -45,8 +83,11 @@ template <Type::Code CODE, int32_t DIM, Bitorder BITORDER>
 struct PackbitsImplBody<VariantKind::GPU, CODE, DIM, BITORDER> {
   using VAL = type_of<CODE>;
 
-  void operator()(const AccessorWO<uint8_t, DIM>& out,
+  template <typename WORD>
+  void operator()(const AccessorWO<WORD, DIM>& out,
                   const AccessorRO<VAL, DIM>& in,
+                  const Rect<DIM>& out_rect,
+                  const Rect<DIM>& in_rect,
                   const Rect<DIM>& aligned_rect,
                   const Rect<DIM>& unaligned_rect,
                   const Pitches<DIM - 1>& aligned_pitches,
@@ -54,12 +95,35 @@ struct PackbitsImplBody<VariantKind::GPU, CODE, DIM, BITORDER> {
                   size_t aligned_volume,
                   size_t unaligned_volume,
                   int64_t in_hi_axis,
-                  uint32_t axis) const
+                  uint32_t axis,
+                  bool dense) const
   {
-    Pack<BITORDER, true /* ALIGNED */> op{};
-    Pack<BITORDER, false /* ALIGNED */> op_unaligned{};
-
     auto stream = get_cached_stream();
+
+    // Fast path: when both stores are dense and packing is done along the
+    // contiguous last axis, each warp packs 32 consecutive elements with a
+    // single ballot instead of an 8-iteration shift loop per output byte
+    if constexpr (sizeof(VAL) == 1 && std::is_same_v<WORD, uint8_t>) {
+      if (dense && axis == static_cast<uint32_t>(DIM - 1)) {
+        const int64_t out_row = out_rect.hi[axis] - out_rect.lo[axis] + 1;
+        const int64_t in_row  = in_rect.hi[axis] - in_rect.lo[axis] + 1;
+        if ((in_row + 7) / 8 == out_row) {
+          auto* outptr               = out.ptr(out_rect);
+          const auto* inptr          = reinterpret_cast<const uint8_t*>(in.ptr(in_rect));
+          const size_t nrows         = out_rect.volume() / out_row;
+          const size_t warps_per_row = (in_row + 31) / 32;
+          const size_t num_warps     = nrows * warps_per_row;
+          const size_t blocks        = (num_warps * 32 + THREADS_PER_BLOCK - 1) / THREADS_PER_BLOCK;
+          ballot_pack_kernel<BITORDER><<<blocks, THREADS_PER_BLOCK, 0, stream>>>(
+            num_warps, warps_per_row, in_row, out_row, outptr, inptr);
+          CUPYNUMERIC_CHECK_CUDA_STREAM(stream);
+          return;
+        }
+      }
+    }
+
+    Pack<BITORDER, true /* ALIGNED */, WORD> op{};
+    Pack<BITORDER, false /* ALIGNED */, WORD> op_unaligned{};
     if (aligned_volume > 0) {
       const size_t blocks = (aligned_volume + THREADS_PER_BLOCK - 1) / THREADS_PER_BLOCK;
       generic_kernel<<<blocks, THREADS_PER_BLOCK, 0, stream>>>(
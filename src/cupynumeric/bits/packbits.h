@@ -21,81 +21,91 @@
 
 namespace cupynumeric {
 
-template <Bitorder BITORDER, bool ALIGNED>
+// Packs one output word of type WORD from 8 * sizeof(WORD) input elements;
+// the bit significance ordering applies across the whole word
+template <Bitorder BITORDER, bool ALIGNED, typename WORD = uint8_t>
 struct Pack;
 
-template <>
-struct Pack<Bitorder::BIG, true /*ALIGNED*/> {
+template <typename WORD>
+struct Pack<Bitorder::BIG, true /*ALIGNED*/, WORD> {
+  static constexpr int64_t BITS = sizeof(WORD) * 8;
+
   template <typename VAL, int32_t DIM>
-  __CUDA_HD__ inline uint8_t operator()(legate::AccessorRO<VAL, DIM> in,
-                                        legate::Point<DIM> p,
-                                        int64_t in_hi_axis,
-                                        uint32_t axis)
+  __CUDA_HD__ inline WORD operator()(legate::AccessorRO<VAL, DIM> in,
+                                     legate::Point<DIM> p,
+                                     int64_t in_hi_axis,
+                                     uint32_t axis)
   {
-    int64_t in_lo = p[axis] * 8;
-    int64_t in_hi = in_lo + 8;
-    uint8_t acc   = 0;
+    int64_t in_lo = p[axis] * BITS;
+    int64_t in_hi = in_lo + BITS;
+    WORD acc      = 0;
     for (int64_t c = in_lo; c < in_hi; ++c) {
       p[axis] = c;
-      acc     = (acc << 1) | static_cast<uint8_t>(in[p] != 0);
+      acc     = (acc << 1) | static_cast<WORD>(in[p] != 0);
     }
     return acc;
   }
 };
 
-template <>
-struct Pack<Bitorder::BIG, false /*ALIGNED*/> {
+template <typename WORD>
+struct Pack<Bitorder::BIG, false /*ALIGNED*/, WORD> {
+  static constexpr int64_t BITS = sizeof(WORD) * 8;
+
   template <typename VAL, int32_t DIM>
-  __CUDA_HD__ inline uint8_t operator()(legate::AccessorRO<VAL, DIM> in,
-                                        legate::Point<DIM> p,
-                                        int64_t in_hi_axis,
-                                        uint32_t axis)
+  __CUDA_HD__ inline WORD operator()(legate::AccessorRO<VAL, DIM> in,
+                                     legate::Point<DIM> p,
+                                     int64_t in_hi_axis,
+                                     uint32_t axis)
   {
-    int64_t in_lo = p[axis] * 8;
-    int64_t in_hi = std::min<int64_t>(in_lo + 8, in_hi_axis + 1);
-    uint8_t acc   = 0;
+    int64_t in_lo = p[axis] * BITS;
+    int64_t in_hi = std::min<int64_t>(in_lo + BITS, in_hi_axis + 1);
+    WORD acc      = 0;
     for (int64_t c = in_lo; c < in_hi; ++c) {
       p[axis] = c;
-      acc     = (acc << 1) | static_cast<uint8_t>(in[p] != 0);
+      acc     = (acc << 1) | static_cast<WORD>(in[p] != 0);
     }
-    acc <<= 8 - (in_hi - in_lo);
+    acc <<= BITS - (in_hi - in_lo);
     return acc;
   }
 };
 
-template <>
-struct Pack<Bitorder::LITTLE, true /*ALIGNED*/> {
+template <typename WORD>
+struct Pack<Bitorder::LITTLE, true /*ALIGNED*/, WORD> {
+  static constexpr int64_t BITS = sizeof(WORD) * 8;
+
   template <typename VAL, int32_t DIM>
-  __CUDA_HD__ inline uint8_t operator()(legate::AccessorRO<VAL, DIM> in,
-                                        legate::Point<DIM> p,
-                                        int64_t in_hi_axis,
-                                        uint32_t axis)
+  __CUDA_HD__ inline WORD operator()(legate::AccessorRO<VAL, DIM> in,
+                                     legate::Point<DIM> p,
+                                     int64_t in_hi_axis,
+                                     uint32_t axis)
   {
-    int64_t in_lo = p[axis] * 8;
-    int64_t in_hi = in_lo + 7;
-    uint8_t acc   = 0;
+    int64_t in_lo = p[axis] * BITS;
+    int64_t in_hi = in_lo + BITS - 1;
+    WORD acc      = 0;
     for (int64_t c = in_hi; c >= in_lo; --c) {
       p[axis] = c;
-      acc     = (acc << 1) | static_cast<uint8_t>(in[p] != 0);
+      acc     = (acc << 1) | static_cast<WORD>(in[p] != 0);
     }
     return acc;
   }
 };
 
-template <>
-struct Pack<Bitorder::LITTLE, false /*ALIGNED*/> {
+template <typename WORD>
+struct Pack<Bitorder::LITTLE, false /*ALIGNED*/, WORD> {
+  static constexpr int64_t BITS = sizeof(WORD) * 8;
+
   template <typename VAL, int32_t DIM>
-  __CUDA_HD__ inline uint8_t operator()(legate::AccessorRO<VAL, DIM> in,
-                                        legate::Point<DIM> p,
-                                        int64_t in_hi_axis,
-                                        uint32_t axis)
+  __CUDA_HD__ inline WORD operator()(legate::AccessorRO<VAL, DIM> in,
+                                     legate::Point<DIM> p,
+                                     int64_t in_hi_axis,
+                                     uint32_t axis)
   {
-    int64_t in_lo = p[axis] * 8;
-    int64_t in_hi = std::min<int64_t>(in_lo + 7, in_hi_axis);
-    uint8_t acc   = 0;
+    int64_t in_lo = p[axis] * BITS;
+    int64_t in_hi = std::min<int64_t>(in_lo + BITS - 1, in_hi_axis);
+    WORD acc      = 0;
     for (int64_t c = in_hi; c >= in_lo; --c) {
       p[axis] = c;
-      acc     = (acc << 1) | static_cast<uint8_t>(in[p] != 0);
+      acc     = (acc << 1) | static_cast<WORD>(in[p] != 0);
     }
     return acc;
   }
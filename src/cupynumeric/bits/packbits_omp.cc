@@ -25,8 +25,11 @@ template <Type::Code CODE, int32_t DIM, Bitorder BITORDER>
 struct PackbitsImplBody<VariantKind::OMP, CODE, DIM, BITORDER> {
   using VAL = type_of<CODE>;
 
-  void operator()(const AccessorWO<uint8_t, DIM>& out,
+  template <typename WORD>
+  void operator()(const AccessorWO<WORD, DIM>& out,
                   const AccessorRO<VAL, DIM>& in,
+                  const Rect<DIM>& out_rect,
+                  const Rect<DIM>& in_rect,
                   const Rect<DIM>& aligned_rect,
                   const Rect<DIM>& unaligned_rect,
                   const Pitches<DIM - 1>& aligned_pitches,
@@ -34,10 +37,11 @@ struct PackbitsImplBody<VariantKind::OMP, CODE, DIM, BITORDER> {
                   size_t aligned_volume,
                   size_t unaligned_volume,
                   int64_t in_hi_axis,
-                  uint32_t axis) const
+                  uint32_t axis,
+                  bool dense) const
   {
-    Pack<BITORDER, true /* ALIGNED */> op{};
-    Pack<BITORDER, false /* ALIGNED */> op_unaligned{};
+    Pack<BITORDER, true /* ALIGNED */, WORD> op{};
+    Pack<BITORDER, false /* ALIGNED */, WORD> op_unaligned{};
 
 #pragma omp parallel for schedule(static)
     for (size_t idx = 0; idx < aligned_volume; ++idx) {
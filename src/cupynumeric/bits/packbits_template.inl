@@ -31,9 +31,47 @@ template <VariantKind KIND, Bitorder BITORDER>
 struct PackbitsImpl {
   template <Type::Code CODE, int32_t DIM, std::enable_if_t<is_integral<CODE>::value>* = nullptr>
   void operator()(legate::PhysicalStore output, legate::PhysicalStore input, uint32_t axis) const
+  {
+    // The output type selects the packed word width
+    switch (output.code()) {
+      case Type::Code::UINT8: {
+        run<uint8_t, CODE, DIM>(output, input, axis);
+        break;
+      }
+      case Type::Code::UINT16: {
+        run<uint16_t, CODE, DIM>(output, input, axis);
+        break;
+      }
+      case Type::Code::UINT32: {
+        run<uint32_t, CODE, DIM>(output, input, axis);
+        break;
+      }
+      case Type::Code::UINT64: {
+        run<uint64_t, CODE, DIM>(output, input, axis);
+        break;
+      }
+      default: {
+        assert(false);
+        break;
+      }
+    }
+  }
+
+  template <Type::Code CODE, int32_t DIM, std::enable_if_t<!is_integral<CODE>::value>* = nullptr>
+  void operator()(legate::PhysicalStore output, legate::PhysicalStore input, uint32_t axis) const
+  {
+    // Unreachable
+    assert(false);
+  }
+
+ private:
+  template <typename WORD, Type::Code CODE, int32_t DIM>
+  void run(legate::PhysicalStore output, legate::PhysicalStore input, uint32_t axis) const
   {
     using VAL = type_of<CODE>;
 
+    constexpr int64_t WORD_BITS = sizeof(WORD) * 8;
+
     auto out_rect = output.shape<DIM>();
 
     if (out_rect.empty()) {
@@ -42,14 +80,14 @@ struct PackbitsImpl {
 
     auto in_rect = input.shape<DIM>();
 
-    auto out = output.write_accessor<uint8_t, DIM>(out_rect);
+    auto out = output.write_accessor<WORD, DIM>(out_rect);
     auto in  = input.read_accessor<VAL, DIM>(in_rect);
 
-    // Compute an output rectangle where each output element can use all 8 input elements
+    // Compute an output rectangle where each output element can use all of its input elements
     // for packing
     auto aligned_rect     = out_rect;
     int64_t axis_extent   = in_rect.hi[axis] - in_rect.lo[axis] + 1;
-    aligned_rect.hi[axis] = aligned_rect.lo[axis] + axis_extent / 8 - 1;
+    aligned_rect.hi[axis] = aligned_rect.lo[axis] + axis_extent / WORD_BITS - 1;
 #ifdef DEBUG_CUPYNUMERIC
     assert(aligned_rect.hi[axis] <= out_rect.hi[axis]);
 #endif
@@ -64,8 +102,19 @@ struct PackbitsImpl {
     auto aligned_volume   = aligned_pitches.flatten(aligned_rect);
     auto unaligned_volume = unaligned_pitches.flatten(unaligned_rect);
 
+#if !LEGATE_DEFINED(LEGATE_BOUNDS_CHECKS)
+    // Check to see if this is dense or not
+    bool dense =
+      out.accessor.is_dense_row_major(out_rect) && in.accessor.is_dense_row_major(in_rect);
+#else
+    // No dense execution if we're doing bounds checks
+    bool dense = false;
+#endif
+
     PackbitsImplBody<KIND, CODE, DIM, BITORDER>{}(out,
                                                   in,
+                                                  out_rect,
+                                                  in_rect,
                                                   aligned_rect,
                                                   unaligned_rect,
                                                   aligned_pitches,
@@ -73,14 +122,8 @@ struct PackbitsImpl {
                                                   aligned_volume,
                                                   unaligned_volume,
                                                   in_rect.hi[axis],
-                                                  axis);
-  }
-
-  template <Type::Code CODE, int32_t DIM, std::enable_if_t<!is_integral<CODE>::value>* = nullptr>
-  void operator()(legate::PhysicalStore output, legate::PhysicalStore input, uint32_t axis) const
-  {
-    // Unreachable
-    assert(false);
+                                                  axis,
+                                                  dense);
   }
 };
 
@@ -0,0 +1,155 @@
+/* Copyright 2024 NVIDIA Corporation
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ */
+
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+
+#if defined(__AVX2__) || defined(__AVX512VPOPCNTDQ__)
+#include <immintrin.h>
+#endif
+
+namespace cupynumeric {
+namespace detail {
+
+// Number of set bits in a single byte
+inline uint64_t popcount_byte(uint8_t v) { return __builtin_popcount(v); }
+
+inline uint64_t popcount_bytes_scalar(const uint8_t* p, size_t n)
+{
+  uint64_t sum = 0;
+  size_t idx   = 0;
+  for (; idx + 8 <= n; idx += 8) {
+    uint64_t word;
+    std::memcpy(&word, p + idx, sizeof(word));
+    sum += __builtin_popcountll(word);
+  }
+  for (; idx < n; ++idx) {
+    sum += popcount_byte(p[idx]);
+  }
+  return sum;
+}
+
+#if defined(__AVX2__) && !defined(__AVX512VPOPCNTDQ__)
+
+// Per-byte popcount via a 4-bit lookup table in each 128-bit lane
+inline __m256i popcount_epi8(__m256i v)
+{
+  // clang-format off
+  const __m256i lut = _mm256_setr_epi8(0, 1, 1, 2, 1, 2, 2, 3, 1, 2, 2, 3, 2, 3, 3, 4,
+                                       0, 1, 1, 2, 1, 2, 2, 3, 1, 2, 2, 3, 2, 3, 3, 4);
+  // clang-format on
+  const __m256i low_mask = _mm256_set1_epi8(0x0f);
+  __m256i lo             = _mm256_and_si256(v, low_mask);
+  __m256i hi             = _mm256_and_si256(_mm256_srli_epi16(v, 4), low_mask);
+  return _mm256_add_epi8(_mm256_shuffle_epi8(lut, lo), _mm256_shuffle_epi8(lut, hi));
+}
+
+// Carry-save adder: (h, l) <- a + b + c, with l holding the low bits and h
+// the carries
+inline void csa(__m256i& h, __m256i& l, __m256i a, __m256i b, __m256i c)
+{
+  const __m256i u = _mm256_xor_si256(a, b);
+  h               = _mm256_or_si256(_mm256_and_si256(a, b), _mm256_and_si256(u, c));
+  l               = _mm256_xor_si256(u, c);
+}
+
+inline __m256i sad_popcount(__m256i v)
+{
+  return _mm256_sad_epu8(popcount_epi8(v), _mm256_setzero_si256());
+}
+
+inline uint64_t hsum_epi64(__m256i v)
+{
+  return static_cast<uint64_t>(_mm256_extract_epi64(v, 0)) +
+         static_cast<uint64_t>(_mm256_extract_epi64(v, 1)) +
+         static_cast<uint64_t>(_mm256_extract_epi64(v, 2)) +
+         static_cast<uint64_t>(_mm256_extract_epi64(v, 3));
+}
+
+// Harley-Seal popcount: a carry-save-adder tree defers the expensive per-byte
+// popcount to every 16th vector, counting 512 bytes per popcount_epi8 call
+inline uint64_t popcount_bytes(const uint8_t* p, size_t n)
+{
+  auto load = [p](size_t block) {
+    return _mm256_loadu_si256(reinterpret_cast<const __m256i*>(p) + block);
+  };
+
+  const size_t blocks = n / 32;
+  __m256i total       = _mm256_setzero_si256();
+  __m256i ones        = _mm256_setzero_si256();
+  __m256i twos        = _mm256_setzero_si256();
+  __m256i fours       = _mm256_setzero_si256();
+  __m256i eights      = _mm256_setzero_si256();
+  __m256i sixteens    = _mm256_setzero_si256();
+  __m256i twosA, twosB, foursA, foursB, eightsA, eightsB;
+
+  size_t block = 0;
+  for (; block + 16 <= blocks; block += 16) {
+    csa(twosA, ones, ones, load(block + 0), load(block + 1));
+    csa(twosB, ones, ones, load(block + 2), load(block + 3));
+    csa(foursA, twos, twos, twosA, twosB);
+    csa(twosA, ones, ones, load(block + 4), load(block + 5));
+    csa(twosB, ones, ones, load(block + 6), load(block + 7));
+    csa(foursB, twos, twos, twosA, twosB);
+    csa(eightsA, fours, fours, foursA, foursB);
+    csa(twosA, ones, ones, load(block + 8), load(block + 9));
+    csa(twosB, ones, ones, load(block + 10), load(block + 11));
+    csa(foursA, twos, twos, twosA, twosB);
+    csa(twosA, ones, ones, load(block + 12), load(block + 13));
+    csa(twosB, ones, ones, load(block + 14), load(block + 15));
+    csa(foursB, twos, twos, twosA, twosB);
+    csa(eightsB, fours, fours, foursA, foursB);
+    csa(sixteens, eights, eights, eightsA, eightsB);
+    total = _mm256_add_epi64(total, sad_popcount(sixteens));
+  }
+  total = _mm256_slli_epi64(total, 4);
+  total = _mm256_add_epi64(total, _mm256_slli_epi64(sad_popcount(eights), 3));
+  total = _mm256_add_epi64(total, _mm256_slli_epi64(sad_popcount(fours), 2));
+  total = _mm256_add_epi64(total, _mm256_slli_epi64(sad_popcount(twos), 1));
+  total = _mm256_add_epi64(total, sad_popcount(ones));
+  for (; block < blocks; ++block) {
+    total = _mm256_add_epi64(total, sad_popcount(load(block)));
+  }
+
+  return hsum_epi64(total) + popcount_bytes_scalar(p + blocks * 32, n - blocks * 32);
+}
+
+#elif defined(__AVX512VPOPCNTDQ__)
+
+// With the VPOPCNTDQ extension a single instruction popcounts 64 bytes
+inline uint64_t popcount_bytes(const uint8_t* p, size_t n)
+{
+  const size_t blocks = n / 64;
+  __m512i total       = _mm512_setzero_si512();
+  for (size_t block = 0; block < blocks; ++block) {
+    __m512i v = _mm512_loadu_si512(reinterpret_cast<const __m512i*>(p) + block);
+    total     = _mm512_add_epi64(total, _mm512_popcnt_epi64(v));
+  }
+  return static_cast<uint64_t>(_mm512_reduce_add_epi64(total)) +
+         popcount_bytes_scalar(p + blocks * 64, n - blocks * 64);
+}
+
+#else
+
+inline uint64_t popcount_bytes(const uint8_t* p, size_t n) { return popcount_bytes_scalar(p, n); }
+
+#endif
+
+}  // namespace detail
+}  // namespace cupynumeric
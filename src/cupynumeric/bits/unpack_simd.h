@@ -0,0 +1,165 @@
+/* Copyright 2024 NVIDIA Corporation
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ */
+
+#pragma once
+
+#include "cupynumeric/bits/bits_util.h"
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+
+#if (defined(__x86_64__) || defined(__i386__)) && defined(__GNUC__)
+#define CUPYNUMERIC_UNPACK_SIMD_X86 1
+#include <immintrin.h>
+#endif
+
+namespace cupynumeric {
+namespace detail {
+
+// Precomputed unpack results: entries[v] holds the 8 output bytes for input
+// byte v, so the inner loop becomes a single 8-byte copy per input byte
+// instead of 8 shift-and-mask iterations
+template <Bitorder BITORDER>
+struct UnpackTable {
+  alignas(8) uint8_t entries[256][8];
+
+  constexpr UnpackTable() : entries{}
+  {
+    for (int32_t val = 0; val < 256; ++val) {
+      for (int32_t bit = 0; bit < 8; ++bit) {
+        entries[val][bit] = static_cast<uint8_t>(BITORDER == Bitorder::BIG ? (val >> (7 - bit)) & 1
+                                                                           : (val >> bit) & 1);
+      }
+    }
+  }
+};
+
+// Lookup-table row kernel; also finishes the tails of the SIMD variants
+template <Bitorder BITORDER>
+void unpack_row_table(uint8_t* out, const uint8_t* in, int64_t n_in, int64_t n_out)
+{
+  static constexpr UnpackTable<BITORDER> table{};
+
+  int64_t byte = 0;
+  for (; byte < n_in && (byte + 1) * 8 <= n_out; ++byte) {
+    std::memcpy(out + byte * 8, table.entries[in[byte]], 8);
+  }
+  if (byte < n_in && byte * 8 < n_out) {
+    std::memcpy(out + byte * 8, table.entries[in[byte]], n_out - byte * 8);
+  }
+}
+
+#if defined(CUPYNUMERIC_UNPACK_SIMD_X86)
+
+// Broadcast-and-test: the input byte is splat across 8 lanes, ANDed with a
+// per-lane single-bit mask, and clamped to 0/1 -- 8 unpacked bytes in ~4
+// instructions per input byte
+template <Bitorder BITORDER>
+__attribute__((target("sse2"))) void unpack_row_sse2(uint8_t* out,
+                                                     const uint8_t* in,
+                                                     int64_t n_in,
+                                                     int64_t n_out)
+{
+  // clang-format off
+  const __m128i mask =
+    BITORDER == Bitorder::BIG
+      ? _mm_setr_epi8(-0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01,
+                      -0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01)
+      : _mm_setr_epi8(0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, -0x80,
+                      0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, -0x80);
+  // clang-format on
+  const __m128i ones = _mm_set1_epi8(1);
+
+  int64_t byte = 0;
+  for (; byte < n_in && (byte + 1) * 8 <= n_out; ++byte) {
+    __m128i x = _mm_set1_epi8(static_cast<char>(in[byte]));
+    __m128i z = _mm_min_epu8(_mm_and_si128(x, mask), ones);
+    _mm_storel_epi64(reinterpret_cast<__m128i*>(out + byte * 8), z);
+  }
+  unpack_row_table<BITORDER>(out + byte * 8, in + byte, n_in - byte, n_out - byte * 8);
+}
+
+// AVX2 variant: four input bytes are broadcast and lane-shuffled so that
+// every group of 8 lanes holds one input byte, producing 32 output bytes
+// per iteration
+template <Bitorder BITORDER>
+__attribute__((target("avx2"))) void unpack_row_avx2(uint8_t* out,
+                                                     const uint8_t* in,
+                                                     int64_t n_in,
+                                                     int64_t n_out)
+{
+  // clang-format off
+  // vpshufb shuffles within 128-bit lanes: the low lane replicates input
+  // bytes 0 and 1, the high lane bytes 2 and 3 of the broadcast word
+  const __m256i splat = _mm256_setr_epi8(0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1,
+                                         2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3);
+  const __m256i mask =
+    BITORDER == Bitorder::BIG
+      ? _mm256_setr_epi8(-0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01,
+                         -0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01,
+                         -0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01,
+                         -0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01)
+      : _mm256_setr_epi8(0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, -0x80,
+                         0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, -0x80,
+                         0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, -0x80,
+                         0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, -0x80);
+  // clang-format on
+  const __m256i ones = _mm256_set1_epi8(1);
+
+  int64_t byte = 0;
+  for (; byte + 4 <= n_in && (byte + 4) * 8 <= n_out; byte += 4) {
+    uint32_t word;
+    std::memcpy(&word, in + byte, sizeof(word));
+    __m256i x = _mm256_shuffle_epi8(_mm256_set1_epi32(static_cast<int32_t>(word)), splat);
+    __m256i z = _mm256_min_epu8(_mm256_and_si256(x, mask), ones);
+    _mm256_storeu_si256(reinterpret_cast<__m256i*>(out + byte * 8), z);
+  }
+  unpack_row_table<BITORDER>(out + byte * 8, in + byte, n_in - byte, n_out - byte * 8);
+}
+
+#endif  // CUPYNUMERIC_UNPACK_SIMD_X86
+
+using UnpackRowFn = void (*)(uint8_t*, const uint8_t*, int64_t, int64_t);
+
+// Picks the widest unpack kernel the host CPU supports; called exactly once
+// per bitorder
+template <Bitorder BITORDER>
+inline UnpackRowFn resolve_unpack_row()
+{
+#if defined(CUPYNUMERIC_UNPACK_SIMD_X86)
+  if (__builtin_cpu_supports("avx2")) {
+    return unpack_row_avx2<BITORDER>;
+  }
+  if (__builtin_cpu_supports("sse2")) {
+    return unpack_row_sse2<BITORDER>;
+  }
+#endif
+  return unpack_row_table<BITORDER>;
+}
+
+// Unpacks one contiguous row of `n_in` input bytes into `n_out` output
+// elements, where n_out may be smaller than 8 * n_in when a count was
+// requested
+template <Bitorder BITORDER>
+inline void unpack_contiguous_row(uint8_t* out, const uint8_t* in, int64_t n_in, int64_t n_out)
+{
+  static const UnpackRowFn fn = resolve_unpack_row<BITORDER>();
+  fn(out, in, n_in, n_out);
+}
+
+}  // namespace detail
+}  // namespace cupynumeric
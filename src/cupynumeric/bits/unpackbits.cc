@@ -16,6 +16,7 @@
 
 #include "cupynumeric/bits/unpackbits.h"
 #include "cupynumeric/bits/unpackbits_template.inl"
+#include "cupynumeric/bits/unpack_simd.h"
 
 namespace cupynumeric {
 
@@ -25,15 +26,33 @@ template <int32_t DIM, Bitorder BITORDER>
 struct UnpackbitsImplBody<VariantKind::CPU, DIM, BITORDER> {
   void operator()(const AccessorWO<uint8_t, DIM>& out,
                   const AccessorRO<uint8_t, DIM>& in,
+                  const Rect<DIM>& out_rect,
                   const Rect<DIM>& in_rect,
                   const Pitches<DIM - 1>& in_pitches,
                   size_t in_volume,
-                  uint32_t axis) const
+                  uint32_t axis,
+                  bool dense) const
   {
+    // Fast path: when both stores are dense and unpacking is done along the
+    // contiguous last axis, every input byte expands to 8 consecutive
+    // output bytes, handled by the lookup-table row kernel
+    if (dense && axis == static_cast<uint32_t>(DIM - 1)) {
+      const int64_t in_row  = in_rect.hi[axis] - in_rect.lo[axis] + 1;
+      const int64_t out_row = out_rect.hi[axis] - out_rect.lo[axis] + 1;
+      auto* outptr          = out.ptr(out_rect);
+      const auto* inptr     = in.ptr(in_rect);
+      const size_t nrows    = in_volume / in_row;
+      for (size_t row = 0; row < nrows; ++row) {
+        detail::unpack_contiguous_row<BITORDER>(
+          outptr + row * out_row, inptr + row * in_row, in_row, out_row);
+      }
+      return;
+    }
+
     Unpack<BITORDER> op{};
     for (size_t idx = 0; idx < in_volume; ++idx) {
       auto in_p = in_pitches.unflatten(idx, in_rect.lo);
-      op(out, in, in_p, axis);
+      op(out, in, in_p, axis, out_rect.hi[axis]);
     }
   }
 };
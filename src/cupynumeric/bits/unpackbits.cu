@@ -31,30 +31,33 @@ static __global__ void __launch_bounds__(THREADS_PER_BLOCK, MIN_CTAS_PER_SM)
                  ReadAcc in,
                  Pitches in_pitches,
                  Point in_lo,
-                 uint32_t axis)
+                 uint32_t axis,
+                 int64_t out_hi_axis)
 {
   const size_t idx = global_tid_1d();
   if (idx >= volume) {
     return;
   }
   auto in_p = in_pitches.unflatten(idx, in_lo);
-  unpack(out, in, in_p, axis);
+  unpack(out, in, in_p, axis, out_hi_axis);
 }
 
 template <int32_t DIM, Bitorder BITORDER>
 struct UnpackbitsImplBody<VariantKind::GPU, DIM, BITORDER> {
   void operator()(const AccessorWO<uint8_t, DIM>& out,
                   const AccessorRO<uint8_t, DIM>& in,
+                  const Rect<DIM>& out_rect,
                   const Rect<DIM>& in_rect,
                   const Pitches<DIM - 1>& in_pitches,
                   size_t in_volume,
-                  uint32_t axis) const
+                  uint32_t axis,
+                  bool dense) const
   {
     Unpack<BITORDER> unpack{};
     auto stream         = get_cached_stream();
     const size_t blocks = (in_volume + THREADS_PER_BLOCK - 1) / THREADS_PER_BLOCK;
     generic_kernel<<<blocks, THREADS_PER_BLOCK, 0, stream>>>(
-      in_volume, unpack, out, in, in_pitches, in_rect.lo, axis);
+      in_volume, unpack, out, in, in_pitches, in_rect.lo, axis, out_rect.hi[axis]);
     CUPYNUMERIC_CHECK_CUDA_STREAM(stream);
   }
 };
@@ -30,13 +30,17 @@ struct Unpack<Bitorder::BIG> {
   __CUDA_HD__ inline void operator()(legate::AccessorWO<uint8_t, DIM> out,
                                      legate::AccessorRO<uint8_t, DIM> in,
                                      legate::Point<DIM> p,
-                                     uint32_t axis) const
+                                     uint32_t axis,
+                                     int64_t out_hi_axis) const
   {
     int64_t out_hi = (p[axis] + 1) * 8 - 1;
     uint8_t val    = in[p];
     for (int32_t idx = 0; idx < 8; ++idx) {
       p[axis] = out_hi - idx;
-      out[p]  = (val >> idx) & 0x01;
+      // Bits beyond the requested count fall outside the output rectangle
+      if (p[axis] <= out_hi_axis) {
+        out[p] = (val >> idx) & 0x01;
+      }
     }
   }
 };
@@ -47,13 +51,17 @@ struct Unpack<Bitorder::LITTLE> {
   __CUDA_HD__ inline void operator()(legate::AccessorWO<uint8_t, DIM> out,
                                      legate::AccessorRO<uint8_t, DIM> in,
                                      legate::Point<DIM> p,
-                                     uint32_t axis) const
+                                     uint32_t axis,
+                                     int64_t out_hi_axis) const
   {
     int64_t out_lo = p[axis] * 8;
     uint8_t val    = in[p];
     for (int32_t idx = 0; idx < 8; ++idx) {
       p[axis] = out_lo + idx;
-      out[p]  = (val >> idx) & 0x01;
+      // Bits beyond the requested count fall outside the output rectangle
+      if (p[axis] <= out_hi_axis) {
+        out[p] = (val >> idx) & 0x01;
+      }
     }
   }
 };
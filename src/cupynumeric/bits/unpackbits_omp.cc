@@ -25,16 +25,18 @@ template <int32_t DIM, Bitorder BITORDER>
 struct UnpackbitsImplBody<VariantKind::OMP, DIM, BITORDER> {
   void operator()(const AccessorWO<uint8_t, DIM>& out,
                   const AccessorRO<uint8_t, DIM>& in,
+                  const Rect<DIM>& out_rect,
                   const Rect<DIM>& in_rect,
                   const Pitches<DIM - 1>& in_pitches,
                   size_t in_volume,
-                  uint32_t axis) const
+                  uint32_t axis,
+                  bool dense) const
   {
     Unpack<BITORDER> op{};
 #pragma omp parallel for schedule(static)
     for (size_t idx = 0; idx < in_volume; ++idx) {
       auto in_p = in_pitches.unflatten(idx, in_rect.lo);
-      op(out, in, in_p, axis);
+      op(out, in, in_p, axis, out_rect.hi[axis]);
     }
   }
 };
@@ -46,7 +46,17 @@ struct UnpackbitsImpl {
     Pitches<DIM - 1> in_pitches{};
     auto in_volume = in_pitches.flatten(in_rect);
 
-    UnpackbitsImplBody<KIND, DIM, BITORDER>{}(out, in, in_rect, in_pitches, in_volume, axis);
+#if !LEGATE_DEFINED(LEGATE_BOUNDS_CHECKS)
+    // Check to see if this is dense or not
+    bool dense =
+      out.accessor.is_dense_row_major(out_rect) && in.accessor.is_dense_row_major(in_rect);
+#else
+    // No dense execution if we're doing bounds checks
+    bool dense = false;
+#endif
+
+    UnpackbitsImplBody<KIND, DIM, BITORDER>{}(
+      out, in, out_rect, in_rect, in_pitches, in_volume, axis, dense);
   }
 
   template <Type::Code CODE, int32_t DIM, std::enable_if_t<!is_integral<CODE>::value>* = nullptr>
@@ -28,6 +28,7 @@ enum CuPyNumericOpCode {
   CUPYNUMERIC_BINARY_OP,
   CUPYNUMERIC_BINARY_RED,
   CUPYNUMERIC_BINCOUNT,
+  CUPYNUMERIC_BITCOUNT,
   CUPYNUMERIC_BITGENERATOR,
   CUPYNUMERIC_CHOOSE,
   CUPYNUMERIC_CONTRACT,
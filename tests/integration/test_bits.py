@@ -89,6 +89,80 @@ class TestPackbits(object):
             out_num = num.packbits(in_num, axis=axis, bitorder=bitorder)
             assert np.array_equal(out_np, out_num)
 
+    def test_wide_dtype_negative(self):
+        in_num = num.random.randint(low=0, high=2, size=(3, 3), dtype="i")
+        # the packed output must be an unsigned integer type
+        with pytest.raises(TypeError):
+            num.packbits(in_num, dtype="i4")
+
+    @pytest.mark.parametrize("dtype", ("u2", "u4", "u8"))
+    @pytest.mark.parametrize("bitorder", ("little", "big"))
+    def test_wide_dtype(self, dtype, bitorder):
+        in_np = np.random.randint(low=0, high=2, size=(3, 17), dtype="B")
+        in_num = num.array(in_np)
+
+        # NumPy has no wide packbits, so build the expected words from the
+        # packed bytes: for "big" the first byte is the most significant
+        itemsize = np.dtype(dtype).itemsize
+        packed = np.packbits(in_np, axis=1, bitorder=bitorder)
+        pad = -packed.shape[1] % itemsize
+        packed = np.pad(packed, ((0, 0), (0, pad)))
+        byteorder = ">" if bitorder == "big" else "<"
+        expected = packed.view(f"{byteorder}u{itemsize}").astype(dtype)
+
+        out_num = num.packbits(in_num, axis=1, dtype=dtype, bitorder=bitorder)
+        assert np.array_equal(expected, out_num)
+
+    @pytest.mark.parametrize("bitorder", ("little", "big"))
+    def test_out(self, bitorder):
+        in_np = np.random.randint(low=0, high=2, size=(4, 20), dtype="B")
+        in_num = num.array(in_np)
+        out_num = num.empty((4, 3), dtype="B")
+
+        result = num.packbits(in_num, axis=1, bitorder=bitorder, out=out_num)
+        assert result is out_num
+        out_np = np.packbits(in_np, axis=1, bitorder=bitorder)
+        assert np.array_equal(out_np, out_num)
+
+    def test_out_mismatch(self):
+        in_num = num.random.randint(low=0, high=2, size=(4, 20), dtype="B")
+        with pytest.raises(ValueError):
+            num.packbits(in_num, axis=1, out=num.empty((4, 2), dtype="B"))
+        with pytest.raises(TypeError):
+            num.packbits(in_num, axis=1, out=num.empty((4, 3), dtype="u2"))
+
+    @pytest.mark.parametrize("dtype", ("u2", "u4", "u8"))
+    def test_wide_dtype_flattened(self, dtype):
+        in_np = np.random.randint(low=0, high=2, size=(4, 9), dtype="B")
+        in_num = num.array(in_np)
+
+        itemsize = np.dtype(dtype).itemsize
+        packed = np.packbits(in_np)
+        pad = -packed.shape[0] % itemsize
+        packed = np.pad(packed, (0, pad))
+        expected = packed.view(f">u{itemsize}").astype(dtype)
+
+        out_num = num.packbits(in_num, dtype=dtype)
+        assert np.array_equal(expected, out_num)
+
+
+class TestPackbitsFast(object):
+    def test_negative(self):
+        # only 1-D bool/uint8 inputs take the fast path
+        in_num = num.random.randint(low=0, high=2, size=(3, 3), dtype="i")
+        with pytest.raises(ValueError):
+            num.packbits_fast(in_num)
+
+    @pytest.mark.parametrize("size", (0, 5, 100))
+    @pytest.mark.parametrize("dtype", ("B", "?"))
+    def test_common(self, size, dtype):
+        in_np = np.random.randint(low=0, high=2, size=size).astype(dtype)
+        in_num = num.array(in_np)
+
+        out_np = np.packbits(in_np)
+        out_num = num.packbits_fast(in_num)
+        assert np.array_equal(out_np, out_num)
+
 
 class TestUnpackbits(object):
     def test_none_arr(self):
@@ -168,6 +242,39 @@ class TestUnpackbits(object):
         out_num = num.unpackbits(in_num, count=count, bitorder=bitorder)
         assert np.array_equal(out_np, out_num)
 
+    @pytest.mark.parametrize("count", (41, 64))
+    @pytest.mark.parametrize("bitorder", ("little", "big"))
+    def test_count_padded(self, count, bitorder):
+        # counts beyond the available bits zero-pad the output
+        in_np = np.random.randint(low=0, high=255, size=(5,), dtype="B")
+        in_num = num.array(in_np)
+
+        out_np = np.unpackbits(in_np, count=count, bitorder=bitorder)
+        out_num = num.unpackbits(in_num, count=count, bitorder=bitorder)
+        assert np.array_equal(out_np, out_num)
+
+    @pytest.mark.parametrize("count", (None, 20, 50))
+    def test_out(self, count):
+        in_np = np.random.randint(low=0, high=255, size=(3, 4), dtype="B")
+        in_num = num.array(in_np)
+        out_shape = (3, 32 if count is None else count)
+        # prefill with ones so stale contents would be caught, in
+        # particular in the zero-padded tail when count > 8 * extent
+        out_num = num.ones(out_shape, dtype="B")
+
+        result = num.unpackbits(in_num, axis=1, count=count, out=out_num)
+        assert result is out_num
+        out_np = np.unpackbits(in_np, axis=1, count=count)
+        assert np.array_equal(out_np, out_num)
+
+    def test_out_mismatch(self):
+        in_np = np.random.randint(low=0, high=255, size=(3, 4), dtype="B")
+        in_num = num.array(in_np)
+        with pytest.raises(ValueError):
+            num.unpackbits(in_num, axis=1, out=num.empty((3, 4), dtype="B"))
+        with pytest.raises(TypeError):
+            num.unpackbits(in_num, axis=1, out=num.empty((3, 32), dtype="i"))
+
     @pytest.mark.parametrize("ndim", range(1, LEGATE_MAX_DIM + 1))
     @pytest.mark.parametrize("bitorder", ("little", "big"))
     def test_axis(self, ndim, bitorder):
@@ -182,7 +289,7 @@ class TestUnpackbits(object):
 
     @pytest.mark.parametrize("ndim", range(1, LEGATE_MAX_DIM + 1))
     @pytest.mark.parametrize("bitorder", ("little", "big"))
-    @pytest.mark.parametrize("count", (-2, 0, 2, 5))
+    @pytest.mark.parametrize("count", (-2, 0, 2, 5, 41))
     def test_axis_count(self, ndim, bitorder, count):
         shape = (5,) * ndim
         in_np = np.random.randint(low=0, high=255, size=shape, dtype="B")
@@ -198,6 +305,29 @@ class TestUnpackbits(object):
             assert np.array_equal(out_np, out_num)
 
 
+class TestCountNonzeroPacked(object):
+    def test_dtype(self):
+        shape = (3, 3)
+        in_num = num.random.random(size=shape)
+        # TypeError: Expected an input array of unsigned byte data type
+        with pytest.raises(TypeError):
+            num.count_nonzero_packed(in_num)
+
+    def test_empty(self):
+        in_num = num.array([], dtype="B")
+        assert int(num.count_nonzero_packed(in_num)) == 0
+
+    @pytest.mark.parametrize("ndim", range(1, LEGATE_MAX_DIM + 1))
+    def test_common(self, ndim):
+        shape = (5,) * ndim
+        in_np = np.random.randint(low=0, high=255, size=shape, dtype="B")
+        in_num = num.array(in_np)
+
+        expected = np.unpackbits(in_np).sum()
+        out_num = num.count_nonzero_packed(in_num)
+        assert int(out_num) == expected
+
+
 @pytest.mark.parametrize("ndim", range(1, LEGATE_MAX_DIM + 1))
 @pytest.mark.parametrize("bitorder", ("little", "big"))
 @pytest.mark.parametrize("dtype", ("B", "i", "?"))